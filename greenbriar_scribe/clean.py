@@ -2,44 +2,53 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Set
-
-import regex as re
+import heapq
+import re
+from collections import Counter
+from typing import AbstractSet, FrozenSet, Iterable, List, Tuple
 
 from .utils import is_page_number, normalize_line
 
+_RE_DEHYPHEN = re.compile(r"([A-Za-z0-9])-\n([A-Za-z])")
+_RE_WS = re.compile(r"(?P<nl>\s*\n\s*)|(?P<sp>[ \t]+)")
+_RE_SENT_END = re.compile(r"[。！？.!?]\s*$")
+_RE_LIST = re.compile(r"^([\-*•]|\d+\.|\d+\)|[a-zA-Z]\))\s+")
+
 
 def detect_header_footer_lines(
     pages_lines: List[List[dict]],
     header_max_lines: int,
     footer_max_lines: int,
     min_repetition_ratio: float,
-) -> Set[str]:
+) -> FrozenSet[str]:
     total_pages = len(pages_lines)
-    if total_pages == 0:
-        return set()
-    counts: Dict[str, int] = {}
+    if total_pages < 2:
+        return frozenset()
+    counts: Counter = Counter()
     for lines in pages_lines:
         if not lines:
             continue
-        sorted_lines = sorted(lines, key=lambda l: (l.get("bbox") or [0, 0, 0, 0])[1])
-        if len(sorted_lines) <= header_max_lines + footer_max_lines:
+        if len(lines) <= header_max_lines + footer_max_lines:
             continue
-        header_lines = sorted_lines[:header_max_lines]
-        footer_lines = sorted_lines[-footer_max_lines:] if footer_max_lines > 0 else []
-        for line in header_lines + footer_lines:
-            text = normalize_line(line.get("text", ""))
-            if not text:
-                continue
-            counts[text] = counts.get(text, 0) + 1
+        # Keyed on (top, index) so ties pick the same lines as slicing a stable sort by top.
+        indexed = list(enumerate(lines))
+        header_lines = heapq.nsmallest(header_max_lines, indexed, key=_indexed_line_top)
+        footer_lines = []
+        if footer_max_lines > 0:
+            footer_lines = heapq.nlargest(footer_max_lines, indexed, key=_indexed_line_top)
+        counts.update(
+            text for text in (normalize_line(line.get("text", "")) for _, line in header_lines + footer_lines) if text
+        )
     threshold = max(2, int(total_pages * min_repetition_ratio + 0.5))
-    if total_pages < 2:
-        return set()
-    repeated = {text for text, count in counts.items() if count >= threshold}
-    return repeated
+    return frozenset(text for text, count in counts.items() if count >= threshold)
 
 
-def remove_headers_footers(lines: Iterable[str], repeated: Set[str]) -> List[str]:
+def _indexed_line_top(item: Tuple[int, dict]) -> Tuple[float, int]:
+    index, line = item
+    return (line.get("bbox") or [0, 0, 0, 0])[1], index
+
+
+def remove_headers_footers(lines: Iterable[str], repeated: AbstractSet[str]) -> List[str]:
     cleaned = []
     for line in lines:
         text = normalize_line(line)
@@ -59,13 +68,20 @@ def remove_page_number_lines(lines: Iterable[str]) -> List[str]:
 
 
 def dehyphenate_text(text: str) -> str:
-    return re.sub(r"([A-Za-z0-9])-\n([A-Za-z])", r"\1\2", text)
+    return _RE_DEHYPHEN.sub(r"\1\2", text)
+
+
+def _ws_repl(match) -> str:
+    return "\n" if match.lastgroup == "nl" else " "
 
 
 def normalize_whitespace(text: str) -> str:
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\s+\n", "\n", text)
-    text = re.sub(r"\n\s+", "\n", text)
+    if "\n" in text:
+        return _RE_WS.sub(_ws_repl, text).strip()
+    if "\t" in text:
+        text = text.replace("\t", " ")
+    if "  " in text:
+        text = " ".join([part for part in text.split(" ") if part])
     return text.strip()
 
 
@@ -96,8 +112,8 @@ def merge_lines_into_paragraphs(lines: List[str]) -> List[str]:
 
 
 def _ends_sentence(line: str) -> bool:
-    return bool(re.search(r"[。！？.!?]\s*$", line))
+    return bool(_RE_SENT_END.search(line))
 
 
 def _is_list_item(text: str) -> bool:
-    return bool(re.match(r"^([\-*•]|\d+\.|\d+\)|[a-zA-Z]\))\s+", text))
+    return bool(_RE_LIST.match(text))
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import argparse
+import multiprocessing as mp
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import List
 
 from .core import Scribe
@@ -18,18 +20,28 @@ def _collect_pdfs(input_path: str, recursive: bool) -> List[str]:
     if not os.path.isdir(input_path):
         return []
     pdfs: List[str] = []
-    if recursive:
-        for root, _, files in os.walk(input_path):
-            for name in files:
-                if name.lower().endswith(".pdf"):
-                    pdfs.append(os.path.join(root, name))
-    else:
-        for name in os.listdir(input_path):
-            if name.lower().endswith(".pdf"):
-                pdfs.append(os.path.join(input_path, name))
+    stack = [input_path]
+    while stack:
+        directory = stack.pop()
+        try:
+            # DirEntry caches the file type from readdir, avoiding a stat per entry.
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if recursive and not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(".pdf"):
+                        pdfs.append(entry.path)
+        except OSError:
+            continue
     return sorted(pdfs)
 
 
+def _process_one(pdf: str, opts: ScribeOptions) -> None:
+    setup_logger(opts.quiet, opts.verbose, opts.log_level)
+    Scribe().process_pdf(pdf, opts)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="greenbriar-scribe")
     parser.add_argument("input", help="PDF file or directory")
@@ -37,9 +49,27 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--doc-id", default=None, help="Override doc_id for single PDF")
     parser.add_argument("--no-ocr", action="store_true", help="Disable OCR")
     parser.add_argument("--ocr-lang", default="ch", help="OCR language for PaddleOCR")
-    parser.add_argument("--ocr-dpi", type=int, default=250, help="OCR render DPI")
-    parser.add_argument("--ocr-workers", type=int, default=2, help="OCR worker processes")
+    parser.add_argument("--ocr-dpi", type=int, default=None, help="OCR render DPI (default: 250)")
+    parser.add_argument(
+        "--ocr-max-long-px",
+        type=int,
+        default=None,
+        help="Cap the OCR render's long side in pixels, lowering DPI on large pages "
+        "(default: 1280 unless --ocr-dpi is given; 0 = no cap)",
+    )
+    parser.add_argument("--ocr-workers", type=int, default=2, help="OCR worker threads")
+    parser.add_argument(
+        "--ocr-processes",
+        action="store_true",
+        help="Run OCR workers as processes (one model each) instead of threads",
+    )
     parser.add_argument("--max-ocr-pages", type=int, default=None, help="Maximum pages to OCR")
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=1,
+        help="Text extraction worker processes for PDFs of 16+ pages (default: 1, in-process)",
+    )
     parser.add_argument("--no-multicol", action="store_true", help="Disable multi-column ordering")
     parser.add_argument("--keep-hf", action="store_true", help="Keep headers/footers")
     parser.add_argument("--hf-ratio", type=float, default=0.6, help="Header/footer repetition ratio")
@@ -47,13 +77,18 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--footer-max-lines", type=int, default=3, help="Footer max lines")
     parser.add_argument("--max-pages-ocr", type=int, default=None, help="Maximum pages to OCR (deprecated)")
     parser.add_argument("--recursive", action="store_true", help="Recurse into directories")
+    parser.add_argument("--jobs", type=int, default=1, help="PDFs to process in parallel")
     parser.add_argument("--quiet", action="store_true", help="Reduce logging")
     parser.add_argument("--verbose", action="store_true", help="Verbose logging")
     parser.add_argument("--mode", default="local", help="Processing mode: local|simpletex_markdown|auto")
     parser.add_argument("--simpletex-token", default=None, help="SimpleTex API token")
     parser.add_argument("--simpletex-api-url", default="https://server.simpletex.cn/api/doc_ocr")
     parser.add_argument("--simpletex-qps", type=float, default=1.0)
+    parser.add_argument(
+        "--simpletex-workers", type=int, default=4, help="Concurrent SimpleTex requests (rate still capped by qps)"
+    )
     parser.add_argument("--simpletex-dpi", type=int, default=150)
+    parser.add_argument("--simpletex-max-long-px", type=int, default=None)
     parser.add_argument("--simpletex-inline-wrapper", nargs=2, default=None)
     parser.add_argument("--simpletex-isolated-wrapper", nargs=2, default=None)
     parser.add_argument("--simpletex-timeout-sec", type=int, default=60)
@@ -77,46 +112,79 @@ def main(argv: List[str] | None = None) -> int:
         logger.error("--doc-id can only be used with a single input PDF")
         return 2
 
-    scribe = Scribe()
-    exit_code = 0
-    
     # Read SimpleTex token from environment if not provided via CLI
     simpletex_token = args.simpletex_token or os.environ.get("SIMPLETEX_TOKEN")
 
-    for pdf in pdfs:
-        opts = ScribeOptions(
-            out_dir=args.out_dir,
-            doc_id=args.doc_id,
-            enable_ocr=not args.no_ocr,
-            ocr_lang=args.ocr_lang,
-            ocr_dpi=args.ocr_dpi,
-            ocr_workers=args.ocr_workers,
-            max_ocr_pages=args.max_ocr_pages,
-            max_pages_ocr=args.max_pages_ocr,
-            multicolumn=not args.no_multicol,
-            remove_headers_footers=not args.keep_hf,
-            header_max_lines=args.header_max_lines,
-            footer_max_lines=args.footer_max_lines,
-            min_repetition_ratio=args.hf_ratio,
-            mode=args.mode,
-            simpletex_token=simpletex_token,
-            simpletex_api_url=args.simpletex_api_url,
-            simpletex_qps=args.simpletex_qps,
-            simpletex_dpi=args.simpletex_dpi,
-            simpletex_inline_formula_wrapper=args.simpletex_inline_wrapper,
-            simpletex_isolated_formula_wrapper=args.simpletex_isolated_wrapper,
-            simpletex_timeout_sec=args.simpletex_timeout_sec,
-            simpletex_max_retries=args.simpletex_max_retries,
-            export_math_crops=args.export_math_crops,
-            math_crop_dpi=args.math_crop_dpi,
-            quiet=args.quiet,
-            verbose=args.verbose,
-        )
-        try:
-            scribe.process_pdf(pdf, opts)
-        except Exception as exc:
-            logger.error("Failed to process %s: %s", pdf, exc)
-            exit_code = 1
+    ocr_dpi = args.ocr_dpi if args.ocr_dpi is not None else 250
+    ocr_max_long_px = args.ocr_max_long_px
+    if ocr_max_long_px is None and args.ocr_dpi is None:
+        ocr_max_long_px = 1280
+
+    jobs = max(1, min(args.jobs, len(pdfs)))
+    ocr_workers = args.ocr_workers
+    simpletex_workers = args.simpletex_workers
+    simpletex_qps = args.simpletex_qps
+    if jobs > 1:
+        # Split the worker budget and the SimpleTex rate limit across concurrently processed PDFs.
+        ocr_workers = max(1, ocr_workers // jobs)
+        simpletex_workers = max(1, simpletex_workers // jobs)
+        simpletex_qps = simpletex_qps / jobs
+
+    opts = ScribeOptions(
+        out_dir=args.out_dir,
+        doc_id=args.doc_id,
+        enable_ocr=not args.no_ocr,
+        ocr_lang=args.ocr_lang,
+        ocr_dpi=ocr_dpi,
+        ocr_max_long_px=ocr_max_long_px or None,
+        ocr_workers=ocr_workers,
+        ocr_use_processes=args.ocr_processes,
+        max_ocr_pages=args.max_ocr_pages,
+        max_pages_ocr=args.max_pages_ocr,
+        extract_workers=args.extract_workers,
+        multicolumn=not args.no_multicol,
+        remove_headers_footers=not args.keep_hf,
+        header_max_lines=args.header_max_lines,
+        footer_max_lines=args.footer_max_lines,
+        min_repetition_ratio=args.hf_ratio,
+        mode=args.mode,
+        simpletex_token=simpletex_token,
+        simpletex_api_url=args.simpletex_api_url,
+        simpletex_qps=simpletex_qps,
+        simpletex_workers=simpletex_workers,
+        simpletex_dpi=args.simpletex_dpi,
+        simpletex_max_long_px=args.simpletex_max_long_px or None,
+        simpletex_inline_formula_wrapper=args.simpletex_inline_wrapper,
+        simpletex_isolated_formula_wrapper=args.simpletex_isolated_wrapper,
+        simpletex_timeout_sec=args.simpletex_timeout_sec,
+        simpletex_max_retries=args.simpletex_max_retries,
+        export_math_crops=args.export_math_crops,
+        math_crop_dpi=args.math_crop_dpi,
+        quiet=args.quiet,
+        verbose=args.verbose,
+    )
+
+    exit_code = 0
+    if jobs == 1:
+        scribe = Scribe()
+        for pdf in pdfs:
+            try:
+                scribe.process_pdf(pdf, opts)
+            except Exception as exc:
+                logger.error("Failed to process %s: %s", pdf, exc)
+                exit_code = 1
+        return exit_code
+
+    ctx = mp.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as ex:
+        futures = {ex.submit(_process_one, pdf, opts): pdf for pdf in pdfs}
+        for future in as_completed(futures):
+            pdf = futures[future]
+            try:
+                future.result()
+            except Exception as exc:
+                logger.error("Failed to process %s: %s", pdf, exc)
+                exit_code = 1
     return exit_code
 
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import multiprocessing as mp
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterator, List, Optional
 
 import fitz
 
@@ -26,14 +28,41 @@ from .output import (
 )
 from .utils import (
     dataclass_to_dict,
+    has_min_nonspace,
     is_page_number,
     markdown_to_text,
     normalize_line,
-    remove_whitespace,
     segment_id,
     setup_logger,
 )
 
+_PARALLEL_MIN_PAGES = 16
+_WORKER_DOCS: Dict[str, fitz.Document] = {}
+
+
+def _extract_page(page: fitz.Page) -> dict:
+    page_dict = extract_mod.extract_page_dict(page)
+    page_text, blocks, lines, stats = extract_mod.extract_all(page_dict)
+    scanned = not has_min_nonspace(page_text, 15)
+    if stats.get("text_blocks", 0) <= 1 and stats.get("image_blocks", 0) > 0:
+        scanned = True
+    return {
+        "page": page.number + 1,
+        "page_width": float(page.rect.width),
+        "text": page_text,
+        "blocks": blocks,
+        "lines": lines,
+        "scanned": scanned,
+    }
+
+
+def _extract_one_page(path: str, page_index: int) -> dict:
+    doc = _WORKER_DOCS.get(path)
+    if doc is None:
+        doc = fitz.open(path)
+        _WORKER_DOCS[path] = doc
+    return _extract_page(doc.load_page(page_index))
+
 
 @dataclass
 class CleanResult:
@@ -95,83 +124,77 @@ class Scribe:
             mode = "simpletex_markdown"
 
         if mode == "simpletex_markdown":
+            doc.close()
             return self._process_simpletex(path, opts, doc_id, warnings, errors)
 
-        pages_data: List[dict] = []
-        ocr_images: List = []
-        ocr_indices: List[int] = []
         max_ocr_pages = opts.max_ocr_pages if opts.max_ocr_pages is not None else opts.max_pages_ocr
-        ocr_pages_used = 0
-        for page_index in range(doc.page_count):
-            page = doc.load_page(page_index)
-            page_width = float(page.rect.width)
-            page_dict = extract_mod.extract_page_dict(page)
-            page_text = extract_mod.extract_page_text(page_dict)
-            blocks, stats = extract_mod.extract_blocks(page_dict)
-            lines = extract_mod.extract_lines(page_dict)
-            scanned = len(remove_whitespace(page_text)) < 15
-            if stats.get("text_blocks", 0) <= 1 and stats.get("image_blocks", 0) > 0:
-                scanned = True
-            source_mode = "extract:text"
-            confidence = None
-            if scanned and ocr_enabled:
-                if max_ocr_pages is None or ocr_pages_used < max_ocr_pages:
-                    try:
-                        ocr_images.append(ocr_mod.render_page_array(page, dpi=opts.ocr_dpi))
-                        ocr_indices.append(page_index)
-                        source_mode = "ocr:pending"
-                        ocr_pages_used += 1
-                    except Exception as exc:
-                        warnings.append(f"OCR render failed on page {page_index + 1}: {exc}")
+        pages_data: List[dict] = []
+
+        def pages_to_ocr():
+            ocr_pages_used = 0
+            for page_data in self._iter_extracted_pages(path, doc, opts, warnings):
+                pages_data.append(page_data)
+                page_index = page_data["page"] - 1
+                scanned = page_data.pop("scanned")
+                source_mode = "extract:text"
+                img = None
+                if scanned and ocr_enabled:
+                    if max_ocr_pages is None or ocr_pages_used < max_ocr_pages:
+                        try:
+                            page = doc.load_page(page_index)
+                            img = ocr_mod.render_page_array(
+                                page, dpi=opts.ocr_dpi, max_long_px=opts.ocr_max_long_px
+                            )
+                            source_mode = "ocr:pending"
+                            ocr_pages_used += 1
+                        except Exception as exc:
+                            warnings.append(f"OCR render failed on page {page_index + 1}: {exc}")
+                            source_mode = "extract:failed_ocr"
+                    else:
+                        warnings.append(f"OCR skipped after max_ocr_pages on page {page_index + 1}.")
                         source_mode = "extract:failed_ocr"
-                else:
-                    warnings.append(f"OCR skipped after max_ocr_pages on page {page_index + 1}.")
+                elif scanned and not ocr_enabled:
+                    warnings.append(f"OCR disabled; scanned page {page_index + 1} extracted as text.")
                     source_mode = "extract:failed_ocr"
-            elif scanned and not ocr_enabled:
-                warnings.append(f"OCR disabled; scanned page {page_index + 1} extracted as text.")
-                source_mode = "extract:failed_ocr"
-            pages_data.append(
-                {
-                    "page": page_index + 1,
-                    "page_width": page_width,
-                    "text": page_text,
-                    "blocks": blocks,
-                    "lines": lines,
-                    "source_mode": source_mode,
-                    "confidence": confidence,
-                }
-            )
-            self.logger.info(
-                "page %s mode=%s chars=%s",
-                page_index + 1,
-                source_mode,
-                len(page_text or ""),
-            )
-
-        if ocr_images:
-            start = time.time()
-            try:
-                results = ocr_mod.ocr_images_parallel(
-                    ocr_images,
-                    lang=opts.ocr_lang,
-                    use_angle_cls=opts.use_angle_cls,
-                    workers=opts.ocr_workers,
+                page_data["source_mode"] = source_mode
+                page_data["confidence"] = None
+                self.logger.info(
+                    "page %s mode=%s chars=%s",
+                    page_index + 1,
+                    source_mode,
+                    len(page_data["text"] or ""),
                 )
-                for (ocr_text, confidence, ocr_blocks), page_index in zip(results, ocr_indices):
-                    pages_data[page_index]["text"] = ocr_text
-                    pages_data[page_index]["blocks"] = ocr_blocks
-                    pages_data[page_index]["lines"] = [
-                        {"text": line, "bbox": None} for line in ocr_text.split("\n") if line
-                    ]
-                    pages_data[page_index]["source_mode"] = "ocr:paddle"
-                    pages_data[page_index]["confidence"] = confidence
-                self.logger.info("OCR batch time %.2fs", time.time() - start)
+                if img is not None:
+                    yield page_index, img
+                    img = None
+
+        start = time.time()
+        ocr_count = 0
+        for page_index, future in ocr_mod.ocr_images_pipelined(
+            pages_to_ocr(),
+            lang=opts.ocr_lang,
+            use_angle_cls=opts.use_angle_cls,
+            workers=opts.ocr_workers,
+            use_processes=opts.ocr_use_processes,
+        ):
+            try:
+                ocr_text, confidence, ocr_blocks = future.result()
             except Exception as exc:
-                warnings.append(f"OCR parallel failed: {exc}")
-                for page_index in ocr_indices:
-                    pages_data[page_index]["source_mode"] = "extract:failed_ocr"
-
-        repeated_lines = set()
+                warnings.append(f"OCR failed on page {page_index + 1}: {exc}")
+                pages_data[page_index]["source_mode"] = "extract:failed_ocr"
+                continue
+            pages_data[page_index]["text"] = ocr_text
+            pages_data[page_index]["blocks"] = ocr_blocks
+            pages_data[page_index]["lines"] = [
+                {"text": line, "bbox": None} for line in ocr_text.split("\n") if line
+            ]
+            pages_data[page_index]["source_mode"] = "ocr:paddle"
+            pages_data[page_index]["confidence"] = confidence
+            ocr_count += 1
+        if ocr_count:
+            self.logger.info("OCR %s pages, pipeline time %.2fs", ocr_count, time.time() - start)
+
+        repeated_lines: FrozenSet[str] = frozenset()
         if opts.remove_headers_footers:
             pages_lines = []
             for page in pages_data:
@@ -194,27 +217,25 @@ class Scribe:
             blocks = page["blocks"]
             if opts.multicolumn and any(b.get("bbox") for b in blocks):
                 blocks = layout_mod.order_blocks(blocks, page_width)
-            font_sizes = [b.get("avg_size") for b in blocks if b.get("avg_size")]
-            font_sizes_sorted = sorted(font_sizes)
+            font_sizes_sorted = sorted(b["avg_size"] for b in blocks if b.get("avg_size"))
             median_size = None
             if font_sizes_sorted:
-                mid = len(font_sizes_sorted) // 2
-                median_size = font_sizes_sorted[mid]
+                median_size = font_sizes_sorted[len(font_sizes_sorted) // 2]
             page_paragraphs: List[str] = []
             segment_index = 1
+            crop_page: Optional[fitz.Page] = None
             for block in blocks:
                 text = block.get("text", "")
                 if not text:
                     continue
-                lines = text.split("\n")
+                norm_pairs = [(line, normalize_line(line)) for line in text.split("\n")]
                 if opts.remove_headers_footers and repeated_lines:
-                    lines = [line for line in lines if normalize_line(line) not in repeated_lines]
+                    norm_pairs = [(line, norm) for line, norm in norm_pairs if norm not in repeated_lines]
                 if opts.remove_page_numbers:
-                    lines = [line for line in lines if not is_page_number(normalize_line(line))]
-                text = "\n".join(lines)
+                    norm_pairs = [(line, norm) for line, norm in norm_pairs if not is_page_number(norm)]
+                text = "\n".join([line for line, _ in norm_pairs])
                 if not text.strip():
                     continue
-                norm_text = clean_mod.normalize_whitespace(text) if opts.normalize_whitespace else text
                 if opts.dehyphenate:
                     text = clean_mod.dehyphenate_text(text)
                 paragraphs = segment_mod.split_block_to_paragraphs(text) if opts.merge_paragraphs else [text]
@@ -233,7 +254,9 @@ class Scribe:
                         block.get("math_hint", False),
                     )
                     if role == "math_complex" and opts.export_math_crops and block.get("bbox"):
-                        self._export_math_crop(doc, page_num, block.get("bbox"), opts, doc_id, segment_index)
+                        if crop_page is None:
+                            crop_page = doc.load_page(page_num - 1)
+                        self._export_math_crop(crop_page, page_num, block.get("bbox"), opts, doc_id, segment_index)
                     segments.append(
                         {
                             "doc_id": doc_id,
@@ -292,6 +315,35 @@ class Scribe:
             meta=meta,
         )
 
+    def _iter_extracted_pages(
+        self,
+        path: str,
+        doc: fitz.Document,
+        opts: ScribeOptions,
+        warnings: List[str],
+    ) -> Iterator[dict]:
+        workers = opts.extract_workers
+        done = 0
+        if workers > 1 and doc.page_count >= _PARALLEL_MIN_PAGES:
+            start = time.time()
+            try:
+                ctx = mp.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+                    for page_data in ex.map(
+                        _extract_one_page,
+                        [path] * doc.page_count,
+                        range(doc.page_count),
+                        chunksize=4,
+                    ):
+                        yield page_data
+                        done += 1
+                self.logger.info("Parallel extraction time %.2fs (%s workers)", time.time() - start, workers)
+                return
+            except Exception as exc:
+                warnings.append(f"Parallel extraction failed: {exc}; falling back to sequential.")
+        for page_index in range(done, doc.page_count):
+            yield _extract_page(doc.load_page(page_index))
+
     def _process_simpletex(
         self,
         path: str,
@@ -310,15 +362,20 @@ class Scribe:
                 token=opts.simpletex_token,
                 api_url=opts.simpletex_api_url,
                 dpi=opts.simpletex_dpi,
+                max_long_px=opts.simpletex_max_long_px,
                 inline_formula_wrapper=opts.simpletex_inline_formula_wrapper,
                 isolated_formula_wrapper=opts.simpletex_isolated_formula_wrapper,
                 qps=opts.simpletex_qps,
+                workers=opts.simpletex_workers,
                 max_retries=opts.simpletex_max_retries,
                 timeout_sec=opts.simpletex_timeout_sec,
             )
         )
 
-        result = backend.pdf_to_markdown(path)
+        try:
+            result = backend.pdf_to_markdown(path)
+        finally:
+            backend.close()
         pages_md = result["pages_md"]
         pages_records = [
             {
@@ -366,7 +423,7 @@ class Scribe:
 
     def _export_math_crop(
         self,
-        doc: fitz.Document,
+        page: fitz.Page,
         page_num: int,
         bbox: list,
         opts: ScribeOptions,
@@ -374,7 +431,6 @@ class Scribe:
         segment_index: int,
     ) -> None:
         try:
-            page = doc.load_page(page_num - 1)
             rect = fitz.Rect(bbox)
             pix = page.get_pixmap(clip=rect, dpi=opts.math_crop_dpi)
             crops_dir = os.path.join(opts.out_dir, "math_crops")
@@ -4,92 +4,124 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
+import numpy as np
+
+# Keeps bound pruning clear of float near-ties at cluster midpoints.
+_PRUNE_SLACK = 1e-9
+
+
+def _nearest_centroid(v: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    order = np.argsort(centroids, kind="stable")
+    sorted_centroids = centroids[order]
+    for i in range(1, order.size):
+        if sorted_centroids[i] == sorted_centroids[i - 1]:
+            order[i] = order[i - 1]
+    mids = (sorted_centroids[:-1] + sorted_centroids[1:]) / 2
+    pos = np.searchsorted(mids, v, side="left")
+    best = order[pos]
+    best_dist = np.abs(v - centroids[best])
+    last = order.size - 1
+    for shift in (-1, 1):
+        other_pos = pos + shift
+        other = order.take(other_pos, mode="clip")
+        other_dist = np.abs(v - centroids[other])
+        closer = (other_dist < best_dist) | ((other_dist == best_dist) & (other < best))
+        closer &= (other_pos >= 0) & (other_pos <= last)
+        best = np.where(closer, other, best)
+        best_dist = np.where(closer, other_dist, best_dist)
+    return best
+
 
 def _kmeans_1d(values: List[float], k: int, iterations: int = 12) -> Tuple[List[int], List[float]]:
     if not values:
         return [], []
-    sorted_vals = sorted(values)
     if k == 1:
         centroid = sum(values) / len(values)
         return [0] * len(values), [centroid]
-    centroids = [sorted_vals[int(i * (len(sorted_vals) - 1) / (k - 1))] for i in range(k)]
+    v = np.asarray(values, dtype=np.float64)
+    n = v.size
+    sorted_vals = np.sort(v)
+    centroids = sorted_vals[[int(i * (n - 1) / (k - 1)) for i in range(k)]]
+    assignments = _nearest_centroid(v, centroids)
+    upper = np.abs(v - centroids[assignments])
     for _ in range(iterations):
-        clusters = [[] for _ in range(k)]
-        for v in values:
-            idx = min(range(k), key=lambda i: abs(v - centroids[i]))
-            clusters[idx].append(v)
-        new_centroids = []
-        for i in range(k):
-            if clusters[i]:
-                new_centroids.append(sum(clusters[i]) / len(clusters[i]))
-            else:
-                new_centroids.append(centroids[i])
-        if new_centroids == centroids:
-            break
+        counts = np.bincount(assignments, minlength=k)
+        sums = np.bincount(assignments, weights=v, minlength=k)
+        new_centroids = np.where(counts > 0, sums / np.maximum(counts, 1), centroids)
+        upper += np.abs(new_centroids - centroids)[assignments]
         centroids = new_centroids
-    assignments = [min(range(k), key=lambda i: abs(v - centroids[i])) for v in values]
-    return assignments, centroids
+        # A point closer to its centroid than half the gap to the nearest other centroid cannot move.
+        half_gap = _half_gaps(centroids)[assignments] * (1 - _PRUNE_SLACK)
+        stale = np.flatnonzero(upper >= half_gap)
+        if stale.size:
+            upper[stale] = np.abs(v[stale] - centroids[assignments[stale]])
+            stale = stale[upper[stale] >= half_gap[stale]]
+        if not stale.size:
+            break
+        reassigned = _nearest_centroid(v[stale], centroids)
+        if np.array_equal(reassigned, assignments[stale]):
+            break
+        assignments[stale] = reassigned
+        upper[stale] = np.abs(v[stale] - centroids[reassigned])
+    return assignments.tolist(), centroids.tolist()
+
+
+def _half_gaps(centroids: np.ndarray) -> np.ndarray:
+    order = np.argsort(centroids, kind="stable")
+    sorted_centroids = centroids[order]
+    gaps = sorted_centroids[1:] - sorted_centroids[:-1]
+    nearest = np.full(centroids.size, np.inf)
+    nearest[:-1] = gaps
+    np.minimum(nearest[1:], gaps, out=nearest[1:])
+    half = np.empty_like(centroids)
+    half[order] = nearest / 2
+    return half
 
 
 def _inertia(values: List[float], assignments: List[int], centroids: List[float]) -> float:
     if not values:
         return 0.0
-    total = 0.0
-    for v, idx in zip(values, assignments):
-        total += (v - centroids[idx]) ** 2
-    return total
+    residuals = np.asarray(values, dtype=np.float64) - np.asarray(centroids, dtype=np.float64)[assignments]
+    return float(residuals @ residuals)
 
 
-def choose_column_count(x0s: List[float], max_k: int = 3) -> int:
+def choose_column_count(x0s: List[float], max_k: int = 3) -> Tuple[int, List[int], List[float]]:
+    """Pick the column count and return it with the fitted (assignments, centroids)."""
+    assign, cent = _kmeans_1d(x0s, 1)
+    chosen = (1, assign, cent)
     if len(x0s) < 4:
-        return 1
-    inertias = []
-    for k in range(1, max_k + 1):
+        return chosen
+    base = _inertia(x0s, assign, cent)
+    for k in range(2, max_k + 1):
         assign, cent = _kmeans_1d(x0s, k)
-        inertias.append(_inertia(x0s, assign, cent))
-    chosen = 1
-    for k in range(1, max_k):
-        base = inertias[k - 1]
-        next_val = inertias[k]
+        next_val = _inertia(x0s, assign, cent)
         improvement = (base - next_val) / base if base > 0 else 0.0
-        if improvement >= 0.2:
-            chosen = k + 1
-        else:
+        if improvement < 0.2:
             break
+        chosen = (k, assign, cent)
+        base = next_val
     return chosen
 
 
 def order_blocks(blocks: List[dict], page_width: float) -> List[dict]:
     if not blocks:
         return []
-    title_blocks = []
-    regular_blocks = []
-    for block in blocks:
-        bbox = block.get("bbox")
-        if bbox:
-            x0, y0, x1, y1 = bbox
-            width = x1 - x0
-            if page_width > 0 and width / page_width >= 0.7:
-                title_blocks.append(block)
-                continue
-        regular_blocks.append(block)
-    title_blocks.sort(key=lambda b: (b.get("bbox") or [0, 0, 0, 0])[1])
-    x0s = [b["bbox"][0] for b in regular_blocks if b.get("bbox")]
-    if not x0s:
-        return title_blocks + regular_blocks
-    k = choose_column_count(x0s)
-    assignments, centroids = _kmeans_1d(x0s, k)
-    columns = {i: [] for i in range(k)}
-    idx = 0
-    for block in regular_blocks:
-        if not block.get("bbox"):
-            continue
-        columns[assignments[idx]].append(block)
-        idx += 1
-    for col in columns.values():
-        col.sort(key=lambda b: b["bbox"][1])
-    ordered_columns = sorted(columns.items(), key=lambda item: centroids[item[0]])
-    ordered_blocks = []
-    for _, col in ordered_columns:
-        ordered_blocks.extend(col)
-    return title_blocks + ordered_blocks
+    boxed = [block for block in blocks if block.get("bbox")]
+    if not boxed:
+        return list(blocks)
+    bboxes = np.array([block["bbox"] for block in boxed], dtype=np.float64)
+    x0s, y0s = bboxes[:, 0], bboxes[:, 1]
+    if page_width > 0:
+        is_title = (bboxes[:, 2] - x0s) / page_width >= 0.7
+    else:
+        is_title = np.zeros(len(boxed), dtype=bool)
+    title_idx = np.flatnonzero(is_title)
+    title_idx = title_idx[np.argsort(y0s[title_idx], kind="stable")]
+    title_blocks = [boxed[i] for i in title_idx]
+    regular_idx = np.flatnonzero(~is_title)
+    if not regular_idx.size:
+        return title_blocks + [block for block in blocks if not block.get("bbox")]
+    _, assignments, centroids = choose_column_count(x0s[regular_idx].tolist())
+    column_rank = np.argsort(np.argsort(centroids, kind="stable"), kind="stable")
+    order = np.lexsort((y0s[regular_idx], column_rank[assignments]))
+    return title_blocks + [boxed[i] for i in regular_idx[order]]
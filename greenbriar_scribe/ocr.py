@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import fitz
 
-from .utils import safe_float
+from .utils import render_zoom, safe_float, submit_bounded
 
 _OCR_INSTANCE = None
+_ENGINE_LOCK = threading.Lock()
+_IDLE_ENGINES: Dict[Tuple[str, bool], List] = {}
 
 
 def is_ocr_available() -> bool:
@@ -19,22 +25,22 @@ def is_ocr_available() -> bool:
     return True
 
 
-def render_page_array(page: fitz.Page, dpi: int = 250):
-    pix = page.get_pixmap(dpi=dpi)
+def render_page_array(page: fitz.Page, dpi: int = 250, max_long_px: Optional[int] = None):
+    zoom = render_zoom(page.rect.width, page.rect.height, dpi, max_long_px)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csRGB, alpha=False)
     return _pixmap_to_numpy(pix)
 
 
 def _pixmap_to_numpy(pix: fitz.Pixmap):
     import numpy as np
 
-    if pix.n < 3:
+    if pix.alpha:
+        pix = fitz.Pixmap(pix, 0)
+    if pix.n != 3:
         pix = fitz.Pixmap(fitz.csRGB, pix)
-    data = pix.samples
-    arr = np.frombuffer(data, dtype=np.uint8)
-    arr = arr.reshape(pix.height, pix.width, pix.n)
-    if pix.n == 4:
-        arr = arr[:, :, :3]
-    return arr[:, :, ::-1]  # RGB to BGR
+    arr = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width, 3)
+    # PaddleOCR expects BGR.
+    return np.ascontiguousarray(arr[:, :, ::-1])
 
 
 def _init_worker(lang: str, use_angle_cls: bool) -> None:
@@ -44,11 +50,28 @@ def _init_worker(lang: str, use_angle_cls: bool) -> None:
     _OCR_INSTANCE = PaddleOCR(use_angle_cls=use_angle_cls, lang=lang)
 
 
-def _ocr_image_array(img) -> Tuple[str, Optional[float], List[dict]]:
-    global _OCR_INSTANCE
-    if _OCR_INSTANCE is None:  # pragma: no cover
-        _init_worker("ch", True)
-    results = _OCR_INSTANCE.ocr(img, cls=True)
+def _new_ocr_engine(lang: str, use_angle_cls: bool):
+    from paddleocr import PaddleOCR
+
+    return PaddleOCR(use_angle_cls=use_angle_cls, lang=lang)
+
+
+@contextmanager
+def _checkout_ocr(lang: str, use_angle_cls: bool):
+    key = (lang, use_angle_cls)
+    with _ENGINE_LOCK:
+        idle = _IDLE_ENGINES.setdefault(key, [])
+        engine = idle.pop() if idle else None
+    if engine is None:
+        engine = _new_ocr_engine(lang, use_angle_cls)
+    try:
+        yield engine
+    finally:
+        with _ENGINE_LOCK:
+            _IDLE_ENGINES[key].append(engine)
+
+
+def _parse_ocr_results(results) -> Tuple[str, Optional[float], List[dict]]:
     lines: List[str] = []
     confs: List[float] = []
     blocks: List[dict] = []
@@ -64,22 +87,63 @@ def _ocr_image_array(img) -> Tuple[str, Optional[float], List[dict]]:
     return "\n".join(lines), confidence, blocks
 
 
+def _ocr_image_array(img) -> Tuple[str, Optional[float], List[dict]]:
+    global _OCR_INSTANCE
+    if _OCR_INSTANCE is None:  # pragma: no cover
+        _init_worker("ch", True)
+    return _parse_ocr_results(_OCR_INSTANCE.ocr(img, cls=True))
+
+
+def _ocr_image_threaded(img, lang: str, use_angle_cls: bool) -> Tuple[str, Optional[float], List[dict]]:
+    with _checkout_ocr(lang, use_angle_cls) as engine:
+        results = engine.ocr(img, cls=True)
+    return _parse_ocr_results(results)
+
+
+def _ocr_executor(lang: str, use_angle_cls: bool, workers: int, use_processes: bool) -> Tuple[Executor, Any]:
+    if use_processes:
+        import multiprocessing as mp
+
+        ex = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(lang, use_angle_cls),
+        )
+        return ex, _ocr_image_array
+    return ThreadPoolExecutor(max_workers=workers), partial(
+        _ocr_image_threaded, lang=lang, use_angle_cls=use_angle_cls
+    )
+
+
+def ocr_images_pipelined(
+    items: Iterable[Tuple[Any, Any]],
+    lang: str = "ch",
+    use_angle_cls: bool = True,
+    workers: int = 2,
+    use_processes: bool = False,
+) -> Iterator[Tuple[Any, Future]]:
+    """OCR ``(key, image)`` pairs lazily, yielding ``(key, future)`` in input order."""
+    workers = max(workers, 1)
+    ex, fn = _ocr_executor(lang, use_angle_cls, workers, use_processes)
+    with ex:
+        yield from submit_bounded(ex, fn, items, 2 * workers)
+
+
 def ocr_images_parallel(
-    images: List,
+    images: Iterable,
     lang: str = "ch",
     use_angle_cls: bool = True,
     workers: int = 2,
+    use_processes: bool = False,
 ) -> List[Tuple[str, Optional[float], List[dict]]]:
-    if not images:
-        return []
-    if workers <= 1:
-        _init_worker(lang, use_angle_cls)
-        return [_ocr_image_array(img) for img in images]
-    import multiprocessing as mp
-
-    ctx = mp.get_context("spawn")
-    with ctx.Pool(processes=workers, initializer=_init_worker, initargs=(lang, use_angle_cls)) as pool:
-        return pool.map(_ocr_image_array, images)
+    pairs = ((None, img) for img in images)
+    return [
+        fut.result()
+        for _, fut in ocr_images_pipelined(
+            pairs, lang=lang, use_angle_cls=use_angle_cls, workers=workers, use_processes=use_processes
+        )
+    ]
 
 
 def ocr_page(
@@ -87,25 +151,14 @@ def ocr_page(
     lang: str = "ch",
     dpi: int = 250,
     use_angle_cls: bool = True,
+    max_long_px: Optional[int] = None,
 ) -> Tuple[str, Optional[float], List[dict]]:
     try:
-        from paddleocr import PaddleOCR
+        import paddleocr  # noqa: F401
     except Exception as exc:  # pragma: no cover - gated by availability
         raise RuntimeError("PaddleOCR is not available") from exc
 
-    img = render_page_array(page, dpi=dpi)
-    ocr = PaddleOCR(use_angle_cls=use_angle_cls, lang=lang)
-    results = ocr.ocr(img, cls=use_angle_cls)
-    lines: List[str] = []
-    confs: List[float] = []
-    blocks: List[dict] = []
-    for line in results[0] if results else []:
-        bbox, (text, conf) = line
-        if text:
-            lines.append(text)
-        conf_val = safe_float(conf)
-        if conf_val is not None:
-            confs.append(conf_val)
-        blocks.append({"text": text, "bbox": None, "avg_size": None, "type": "ocr"})
-    confidence = sum(confs) / len(confs) if confs else None
-    return "\n".join(lines), confidence, blocks
+    img = render_page_array(page, dpi=dpi, max_long_px=max_long_px)
+    with _checkout_ocr(lang, use_angle_cls) as engine:
+        results = engine.ocr(img, cls=use_angle_cls)
+    return _parse_ocr_results(results)
@@ -13,10 +13,13 @@ class ScribeOptions:
     enable_ocr: bool = True
     ocr_lang: str = "ch"
     ocr_dpi: int = 250
+    ocr_max_long_px: Optional[int] = None
     use_angle_cls: bool = True
     ocr_workers: int = 2
+    ocr_use_processes: bool = False
     max_ocr_pages: Optional[int] = None
     max_pages_ocr: Optional[int] = None
+    extract_workers: int = 1
     multicolumn: bool = True
     remove_headers_footers: bool = True
     header_max_lines: int = 3
@@ -30,7 +33,9 @@ class ScribeOptions:
     simpletex_token: Optional[str] = None
     simpletex_api_url: str = "https://server.simpletex.cn/api/doc_ocr"
     simpletex_qps: float = 1.0
+    simpletex_workers: int = 4
     simpletex_dpi: int = 150
+    simpletex_max_long_px: Optional[int] = None
     simpletex_inline_formula_wrapper: Optional[list] = None
     simpletex_isolated_formula_wrapper: Optional[list] = None
     simpletex_timeout_sec: int = 60
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
-
-import regex as re
+import re
+from typing import AbstractSet, List, Optional
 
 from .clean import merge_lines_into_paragraphs
 from .utils import normalize_line
 
+# Separate searches, not one alternation: "1 2 3/4" must count as both table and frac.
+_RE_LIST = re.compile(r"^([\-*•]|\d+\.|\d+\)|[a-zA-Z]\))\s+")
+_RE_TABLE_NUMS = re.compile(r"\d+\s+\d+\s+\d+")
+_RE_MATH_SUP = re.compile(r"[_^]\{")
+_RE_MATH_SYMS = re.compile(r"[=<>±×÷∑∫√∞≈≠≤≥πθλμΩαβγδΔΣ∏∂]")
+_RE_MATH_FN = re.compile(r"\b(sin|cos|tan|log|ln|exp)\b")
+_RE_FRAC = re.compile(r"\d+/\d+")
+
 
 def classify_role(
     text: str,
@@ -16,7 +23,7 @@ def classify_role(
     page_median_size: Optional[float],
     page_width: float,
     bbox: Optional[list],
-    repeated_headers_footers: set,
+    repeated_headers_footers: AbstractSet[str],
     math_hint: bool = False,
 ) -> str:
     norm = normalize_line(text)
@@ -50,13 +57,13 @@ def split_block_to_paragraphs(text: str) -> List[str]:
 
 
 def _is_list_item(text: str) -> bool:
-    return bool(re.match(r"^([\-*•]|\d+\.|\d+\)|[a-zA-Z]\))\s+", text))
+    return bool(_RE_LIST.match(text))
 
 
 def _is_table_like(text: str) -> bool:
     if "  " in text:
         return True
-    if re.search(r"\d+\s+\d+\s+\d+", text):
+    if _RE_TABLE_NUMS.search(text):
         return True
     if text.count("|") >= 2:
         return True
@@ -65,12 +72,12 @@ def _is_table_like(text: str) -> bool:
 
 def _math_score(text: str) -> int:
     score = 0
-    if re.search(r"[_^]\{", text):
+    if _RE_MATH_SUP.search(text):
         score += 2
-    if re.search(r"[=<>±×÷∑∫√∞≈≠≤≥πθλμΩαβγδΔΣ∏∂]", text):
+    if _RE_MATH_SYMS.search(text):
         score += 2
-    if re.search(r"\b(sin|cos|tan|log|ln|exp)\b", text):
+    if _RE_MATH_FN.search(text):
         score += 1
-    if re.search(r"\d+/\d+", text):
+    if _RE_FRAC.search(text):
         score += 1
     return score
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import fitz
 
+from .utils import render_zoom, submit_bounded
+
+_JPEG_MIN_PNG_BYTES = 1 << 20
+
 
 def is_simpletex_available() -> bool:
     try:
@@ -23,38 +29,68 @@ class SimpleTexOptions:
     token: str
     api_url: str = "https://server.simpletex.cn/api/doc_ocr"
     dpi: int = 150
+    max_long_px: Optional[int] = None
     inline_formula_wrapper: Optional[List[str]] = None
     isolated_formula_wrapper: Optional[List[str]] = None
     qps: float = 1.0
     max_retries: int = 2
     timeout_sec: int = 60
+    jpeg_quality: int = 92
+    workers: int = 4
 
 
 class SimpleTexMarkdownBackend:
     def __init__(self, opts: SimpleTexOptions):
         self.opts = opts
-        self._min_interval = 1.0 / max(opts.qps, 0.1)
-        self._last_call_ts = 0.0
+        self._min_interval = 1.0 / opts.qps if opts.qps > 0 else 10.0
+        self._workers = max(opts.workers, 1)
+        self._next_call_ts = 0.0
+        self._rate_lock = threading.Lock()
+        self._session = None
+
+    def _get_session(self):
+        # No adapter retries: _ocr_page_markdown retries so every attempt passes the QPS gate.
+        with self._rate_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=self._workers, max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def close(self) -> None:
+        with self._rate_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
 
     def _sleep_if_needed(self) -> None:
-        now = time.time()
-        gap = now - self._last_call_ts
-        if gap < self._min_interval:
-            time.sleep(self._min_interval - gap)
-
-    @staticmethod
-    def _pixmap_to_png_bytes(pix: fitz.Pixmap) -> bytes:
-        return pix.tobytes("png")
-
-    def _render_page_png(self, page: fitz.Page) -> bytes:
-        zoom = self.opts.dpi / 72.0
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_call_ts)
+            self._next_call_ts = slot + self._min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _pixmap_to_upload(self, pix: fitz.Pixmap) -> Tuple[str, bytes, str]:
+        png_bytes = pix.tobytes("png")
+        if not pix.alpha and len(png_bytes) >= _JPEG_MIN_PNG_BYTES:
+            jpg_bytes = pix.tobytes("jpg", jpg_quality=self.opts.jpeg_quality)
+            if len(jpg_bytes) < len(png_bytes):
+                return ("page.jpg", jpg_bytes, "image/jpeg")
+        return ("page.png", png_bytes, "image/png")
+
+    def _render_page_image(self, page: fitz.Page) -> Tuple[str, bytes, str]:
+        zoom = render_zoom(page.rect.width, page.rect.height, self.opts.dpi, self.opts.max_long_px)
         mat = fitz.Matrix(zoom, zoom)
         pix = page.get_pixmap(matrix=mat, alpha=False)
-        return self._pixmap_to_png_bytes(pix)
-
-    def _ocr_page(self, png_bytes: bytes) -> Dict:
-        import requests
+        return self._pixmap_to_upload(pix)
 
+    def _ocr_page(self, image: Tuple[str, bytes, str]) -> Dict:
         data = {}
         if self.opts.inline_formula_wrapper is not None:
             data["inline_formula_wrapper"] = json.dumps(self.opts.inline_formula_wrapper, ensure_ascii=False)
@@ -64,12 +100,11 @@ class SimpleTexMarkdownBackend:
             )
 
         headers = {"token": self.opts.token}
-        files = {"file": ("page.png", png_bytes, "image/png")}
+        files = {"file": image}
 
         self._sleep_if_needed()
-        self._last_call_ts = time.time()
 
-        resp = requests.post(
+        resp = self._get_session().post(
             self.opts.api_url,
             headers=headers,
             files=files,
@@ -79,39 +114,39 @@ class SimpleTexMarkdownBackend:
         resp.raise_for_status()
         return resp.json()
 
+    def _ocr_page_markdown(self, image: Tuple[str, bytes, str]) -> Tuple[Optional[Dict], Optional[str]]:
+        attempt = 0
+        last_err = None
+        while attempt <= self.opts.max_retries:
+            try:
+                res = self._ocr_page(image)
+                if not res.get("status"):
+                    raise RuntimeError(f"SimpleTex status=false: {res}")
+                return {"markdown": res["res"]["content"], "request_id": res.get("request_id")}, None
+            except Exception as exc:
+                last_err = str(exc)
+                attempt += 1
+                if attempt <= self.opts.max_retries:
+                    time.sleep(1.0 * attempt)
+        return None, last_err
+
+    def _iter_page_images(self, doc: fitz.Document) -> Iterator[Tuple[int, Tuple[str, bytes, str]]]:
+        for i in range(doc.page_count):
+            yield i, self._render_page_image(doc.load_page(i))
+
     def pdf_to_markdown(self, pdf_path: str) -> Dict:
-        doc = fitz.open(pdf_path)
         pages_md: List[dict] = []
         errors: List[dict] = []
 
-        for i in range(doc.page_count):
-            page = doc.load_page(i)
-            png = self._render_page_png(page)
-
-            attempt = 0
-            ok = False
-            last_err = None
-            while attempt <= self.opts.max_retries and not ok:
-                try:
-                    res = self._ocr_page(png)
-                    if not res.get("status"):
-                        raise RuntimeError(f"SimpleTex status=false: {res}")
-                    content = res["res"]["content"]
-                    pages_md.append(
-                        {
-                            "page": i + 1,
-                            "markdown": content,
-                            "request_id": res.get("request_id"),
-                        }
-                    )
-                    ok = True
-                except Exception as exc:
-                    last_err = str(exc)
-                    attempt += 1
-                    time.sleep(1.0 * attempt)
-
-            if not ok:
-                errors.append({"page": i + 1, "error": last_err})
+        with fitz.open(pdf_path) as doc, ThreadPoolExecutor(max_workers=self._workers) as ex:
+            page_count = doc.page_count
+            pages = self._iter_page_images(doc)
+            for i, future in submit_bounded(ex, self._ocr_page_markdown, pages, 2 * self._workers):
+                page_md, err = future.result()
+                if page_md is None:
+                    errors.append({"page": i + 1, "error": err})
+                else:
+                    pages_md.append({"page": i + 1, **page_md})
 
         full_parts = []
         for p in pages_md:
@@ -119,7 +154,7 @@ class SimpleTexMarkdownBackend:
         full_markdown = "\n".join(full_parts).strip()
 
         return {
-            "pages": doc.page_count,
+            "pages": page_count,
             "pages_md": pages_md,
             "full_markdown": full_markdown,
             "errors": errors,
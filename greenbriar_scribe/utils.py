@@ -6,8 +6,35 @@ import json
 import logging
 import os
 import re
+import sys
+from collections import deque
+from concurrent.futures import Executor, Future
 from dataclasses import asdict
-from typing import Iterable, Optional
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_WRITE_BUFFER_SIZE = 1 << 20
+# json.dumps coerces int/float/bool/None dict keys to strings; orjson needs an opt-in to match.
+_ORJSON_LINE_OPTS = (orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+_ORJSON_DOC_OPTS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+_JSON_LINE_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+_RE_WS = re.compile(r"\s+")
+_RE_PAGENUM = re.compile(r"\d{1,4}")
+_RE_PAGE_OF = re.compile(r"(?i)page\s+\d+(\s*/\s*\d+)?")
+
+_RE_MD_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_RE_MD_FENCE = re.compile(r"```.*?```", re.DOTALL)
+_RE_MD_BLOCKMATH = re.compile(r"\$\$.*?\$\$", re.DOTALL)
+_RE_MD_INLINEMATH = re.compile(r"\$.*?\$", re.DOTALL)
+_RE_MD_IMG = re.compile(r"!\[.*?\]\(.*?\)")
+_RE_MD_HEADING = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_RE_MD_EMPH = re.compile(r"\*\*|__|\*|_")
 
 
 def setup_logger(quiet: bool = False, verbose: bool = False, log_level: Optional[str] = None) -> logging.Logger:
@@ -30,35 +57,86 @@ def setup_logger(quiet: bool = False, verbose: bool = False, log_level: Optional
 
 
 def remove_whitespace(text: str) -> str:
-    return re.sub(r"\s+", "", text or "")
+    return _RE_WS.sub("", text or "")
+
+
+def has_min_nonspace(text: str, count: int) -> bool:
+    seen = 0
+    for ch in text or "":
+        if not ch.isspace():
+            seen += 1
+            if seen >= count:
+                return True
+    return count <= 0
 
 
+def render_zoom(width: float, height: float, dpi: int, max_long_px: Optional[int] = None) -> float:
+    zoom = dpi / 72.0
+    long_side = max(width, height)
+    if max_long_px and long_side > 0:
+        zoom = min(zoom, max_long_px / long_side)
+    return zoom
+
+
+@lru_cache(maxsize=16384)
 def normalize_line(text: str) -> str:
-    return re.sub(r"\s+", " ", text or "").strip()
+    return sys.intern(_RE_WS.sub(" ", text or "").strip())
 
 
 def is_page_number(text: str) -> bool:
     stripped = normalize_line(text)
     if not stripped:
         return False
-    if re.fullmatch(r"\d{1,4}", stripped):
+    if _RE_PAGENUM.fullmatch(stripped):
         return True
-    if re.fullmatch(r"(?i)page\s+\d+(\s*/\s*\d+)?", stripped):
+    if _RE_PAGE_OF.fullmatch(stripped):
         return True
     return False
 
 
+def submit_bounded(
+    executor: Executor,
+    fn: Callable[[Any], Any],
+    items: Iterable[Tuple[Any, Any]],
+    depth: int,
+) -> Iterator[Tuple[Any, Future]]:
+    """Submit ``fn(arg)`` for each ``(key, arg)`` and yield ``(key, future)`` in input order.
+
+    ``items`` is pulled lazily in the calling thread and at most ``depth`` futures are pending.
+    Producing the next input (e.g. rendering a page, which must stay on the thread that owns
+    the PyMuPDF document) thus overlaps with the workers while memory stays bounded.
+    """
+    pending: deque = deque()
+    for key, arg in items:
+        pending.append((key, executor.submit(fn, arg)))
+        del arg
+        if len(pending) >= depth:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
+
+
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
 def jsonl_write(path: str, records: Iterable[dict]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
+    if orjson is not None:
+        with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            for record in records:
+                f.write(orjson.dumps(record, option=_ORJSON_LINE_OPTS))
+        return
+    encode = _JSON_LINE_ENCODER.encode
+    with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
         for record in records:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.write(encode(record) + "\n")
 
 
 def json_write(path: str, payload: dict) -> None:
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload, option=_ORJSON_DOC_OPTS))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
@@ -81,14 +159,12 @@ def safe_float(value) -> Optional[float]:
 
 
 def markdown_to_text(md: str) -> str:
-    import regex as re
-
-    text = re.sub(r"<!--.*?-->", "", md, flags=re.DOTALL)
-    text = re.sub(r"```.*?```", "", text, flags=re.DOTALL)
-    text = re.sub(r"\\$\\$.*?\\$\\$", " ", text, flags=re.DOTALL)
-    text = re.sub(r"\\$.*?\\$", " ", text, flags=re.DOTALL)
-    text = re.sub(r"!\\[.*?\\]\\(.*?\\)", " ", text)
-    text = re.sub(r"#+\\s+", "", text)
-    text = re.sub(r"\\*\\*|__|\\*|_", "", text)
-    text = re.sub(r"\\s+", " ", text)
+    text = _RE_MD_COMMENT.sub("", md)
+    text = _RE_MD_FENCE.sub("", text)
+    text = _RE_MD_BLOCKMATH.sub(" ", text)
+    text = _RE_MD_INLINEMATH.sub(" ", text)
+    text = _RE_MD_IMG.sub(" ", text)
+    text = _RE_MD_HEADING.sub("", text)
+    text = _RE_MD_EMPH.sub("", text)
+    text = _RE_WS.sub(" ", text)
     return text.strip()
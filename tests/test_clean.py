@@ -0,0 +1,40 @@
+from greenbriar_scribe.clean import dehyphenate_text, detect_header_footer_lines, normalize_whitespace
+
+
+def test_normalize_whitespace():
+    assert normalize_whitespace("  a \t b  ") == "a b"
+    assert normalize_whitespace("a  \n\n  b") == "a\nb"
+    assert normalize_whitespace("a \r\n\tb\n") == "a\nb"
+    assert normalize_whitespace("a　b") == "a　b"
+    assert normalize_whitespace(" \n\t ") == ""
+
+
+def test_dehyphenate_text():
+    assert dehyphenate_text("demon-\nstration") == "demonstration"
+    assert dehyphenate_text("x -\ny") == "x -\ny"
+
+
+def _page_lines(header, body, footer):
+    lines = [{"text": header, "bbox": [72, 30, 300, 40]}]
+    lines += [{"text": text, "bbox": [72, 100 + 12 * i, 500, 110 + 12 * i]} for i, text in enumerate(body)]
+    lines.append({"text": footer, "bbox": [72, 760, 300, 770]})
+    return lines
+
+
+def test_detect_header_footer_lines():
+    pages = [_page_lines("Journal  Title", [f"line {p}-{i}" for i in range(5)], f"Footer {p % 2}") for p in range(4)]
+    repeated = detect_header_footer_lines(pages, 1, 1, 0.5)
+    assert repeated == {"Journal Title", "Footer 0", "Footer 1"}
+    assert detect_header_footer_lines(pages[:1], 1, 1, 0.5) == set()
+
+
+def test_detect_header_footer_lines_footer_tie_keeps_last_line():
+    # Footer text and page number share a baseline; like a stable sort, the later line wins.
+    pages = []
+    for p in range(5):
+        lines = [{"text": "Header", "bbox": [72, 30, 300, 40]}]
+        lines += [{"text": f"body {p}-{i}", "bbox": [72, 100 + 12 * i, 500, 110 + 12 * i]} for i in range(3)]
+        lines.append({"text": "Journal of Things", "bbox": [72, 760, 300, 770]})
+        lines.append({"text": str(p + 1), "bbox": [500, 760, 520, 770]})
+        pages.append(lines)
+    assert detect_header_footer_lines(pages, 1, 1, 0.5) == {"Header"}
@@ -0,0 +1,40 @@
+import os
+
+import fitz
+
+from greenbriar_scribe.cli import _collect_pdfs, main
+
+
+def test_collect_pdfs(tmp_path):
+    (tmp_path / "b.pdf").write_bytes(b"")
+    (tmp_path / "A.PDF").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+    nested = tmp_path / "sub" / "deeper"
+    nested.mkdir(parents=True)
+    (nested / "c.pdf").write_bytes(b"")
+
+    flat = _collect_pdfs(str(tmp_path), recursive=False)
+    assert flat == sorted([str(tmp_path / "A.PDF"), str(tmp_path / "b.pdf")])
+
+    deep = _collect_pdfs(str(tmp_path), recursive=True)
+    assert deep == sorted(flat + [str(nested / "c.pdf")])
+
+    assert _collect_pdfs(str(tmp_path / "b.pdf"), recursive=False) == [str(tmp_path / "b.pdf")]
+    assert _collect_pdfs(os.path.join(str(tmp_path), "missing"), recursive=True) == []
+
+
+def test_main_parallel_jobs(tmp_path, capfd):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    for name in ("one", "two", "three"):
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 100), f"Body of {name}.")
+        doc.save(str(corpus / f"{name}.pdf"))
+        doc.close()
+    out_dir = tmp_path / "out"
+
+    assert main([str(corpus), "-o", str(out_dir), "--no-ocr", "--quiet", "--jobs", "2"]) == 0
+    assert " INFO " not in capfd.readouterr().err
+    for name in ("one", "two", "three"):
+        with open(out_dir / f"{name}.cleaned.txt", "r", encoding="utf-8") as f:
+            assert f"Body of {name}." in f.read()
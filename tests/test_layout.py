@@ -0,0 +1,40 @@
+from greenbriar_scribe.layout import _kmeans_1d, choose_column_count, order_blocks
+
+
+def _block(text, x0, y0, width=200, height=20):
+    return {"text": text, "bbox": [x0, y0, x0 + width, y0 + height]}
+
+
+def test_kmeans_1d_two_clusters():
+    values = [72.0, 73.0, 71.5, 310.0, 312.0, 309.0]
+    assignments, centroids = _kmeans_1d(values, 2)
+    assert assignments == [0, 0, 0, 1, 1, 1]
+    assert centroids[0] < 80 < 300 < centroids[1]
+    assert _kmeans_1d([], 2) == ([], [])
+
+
+def test_kmeans_1d_midpoint_tie_matches_argmin():
+    # 75.0 sits on the midpoint of two rational centroids; float distances decide the tie.
+    values = [203, 92, 173, 199, 72, -29, 252, 72, 75, 202, 200, 73, 164, 200, 201, 203, 72, 211, 29, 95, 201,
+              230, 65, 72, 96]
+    assignments, centroids = _kmeans_1d(values, 3)
+    assert centroids == [0.0, 78.4, 203.0]
+    assert assignments[values.index(75)] == 1
+
+
+def test_order_blocks_two_columns():
+    blocks = [
+        _block("right-2", 310, 300),
+        _block("left-1", 72, 100),
+        _block("title", 50, 40, width=500),
+        _block("right-1", 310, 100),
+        _block("left-3", 72, 500),
+        _block("left-2", 72, 300),
+        _block("right-3", 310, 500),
+    ]
+    x0s = [b["bbox"][0] for b in blocks if b["text"] != "title"]
+    k, assignments, centroids = choose_column_count(x0s)
+    assert k == 2
+    assert (assignments, centroids) == _kmeans_1d(x0s, 2)
+    ordered = [b["text"] for b in order_blocks(blocks, 612)]
+    assert ordered == ["title", "left-1", "left-2", "left-3", "right-1", "right-2", "right-3"]
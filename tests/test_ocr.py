@@ -0,0 +1,109 @@
+import json
+import sys
+import textwrap
+
+import fitz
+import numpy as np
+import pytest
+
+from greenbriar_scribe import Scribe, ScribeOptions
+from greenbriar_scribe import ocr as ocr_mod
+
+# Stand-in for paddleocr: reports the image width as text, fails on dark pages, and answers
+# narrower (earlier) pages more slowly so results complete out of page order.
+_STUB_PADDLEOCR = textwrap.dedent(
+    """
+    import time
+
+
+    class PaddleOCR:
+        def __init__(self, use_angle_cls=True, lang="ch"):
+            pass
+
+        def ocr(self, img, cls=True):
+            if img.mean() < 128:
+                raise RuntimeError("stub failure")
+            time.sleep(max(0.0, 0.3 - img.shape[1] / 5000))
+            return [[(None, (f"{img.shape[1]}px", 0.9))]]
+    """
+)
+
+
+@pytest.fixture
+def stub_paddleocr(tmp_path, monkeypatch):
+    stub_dir = tmp_path / "stub"
+    stub_dir.mkdir()
+    (stub_dir / "paddleocr.py").write_text(_STUB_PADDLEOCR, encoding="utf-8")
+    # On sys.path (not just monkeypatched) so spawned OCR worker processes find it too.
+    monkeypatch.syspath_prepend(str(stub_dir))
+    monkeypatch.setattr(ocr_mod, "_IDLE_ENGINES", {})
+    sys.modules.pop("paddleocr", None)
+    yield
+    sys.modules.pop("paddleocr", None)
+
+
+def _create_scanned_pdf(path, widths, dark=()):
+    doc = fitz.open()
+    for i, width in enumerate(widths):
+        page = doc.new_page(width=width, height=792)
+        if i in dark:
+            page.draw_rect(page.rect, color=(0, 0, 0), fill=(0, 0, 0))
+    doc.save(path)
+    doc.close()
+
+
+def _run(tmp_path, widths, dark=(), **kwargs):
+    pdf_path = tmp_path / "scan.pdf"
+    _create_scanned_pdf(str(pdf_path), widths, dark)
+    opts = ScribeOptions(out_dir=str(tmp_path / "out"), enable_ocr=True, **kwargs)
+    result = Scribe().process_pdf(str(pdf_path), opts)
+    with open(result.pages_jsonl_path, "r", encoding="utf-8") as f:
+        pages = [json.loads(line) for line in f]
+    return pages, result.meta["warnings"]
+
+
+def _widths_px(pages):
+    return [int(page["text"][:-2]) for page in pages]
+
+
+def test_ocr_results_land_on_their_pages(tmp_path, stub_paddleocr):
+    pages, warnings = _run(tmp_path, [300, 400, 500, 600], ocr_workers=2)
+    assert [page["source_mode"] for page in pages] == ["ocr:paddle"] * 4
+    px = _widths_px(pages)
+    assert px == sorted(px) and len(set(px)) == 4
+    assert not warnings
+
+
+def test_ocr_failure_is_reported_per_page(tmp_path, stub_paddleocr):
+    pages, warnings = _run(tmp_path, [300, 400, 500], dark={1}, ocr_workers=2)
+    assert [page["source_mode"] for page in pages] == ["ocr:paddle", "extract:failed_ocr", "ocr:paddle"]
+    assert warnings == ["OCR failed on page 2: stub failure"]
+
+
+def test_max_ocr_pages_is_honoured(tmp_path, stub_paddleocr):
+    pages, warnings = _run(tmp_path, [300, 400, 500], max_ocr_pages=2, ocr_workers=2)
+    assert [page["source_mode"] for page in pages] == ["ocr:paddle", "ocr:paddle", "extract:failed_ocr"]
+    assert warnings == ["OCR skipped after max_ocr_pages on page 3."]
+
+
+def test_ocr_process_pool_path(tmp_path, stub_paddleocr):
+    pages, warnings = _run(tmp_path, [300, 400, 500], dark={2}, ocr_workers=2, ocr_use_processes=True)
+    assert [page["source_mode"] for page in pages] == ["ocr:paddle", "ocr:paddle", "extract:failed_ocr"]
+    px = _widths_px(pages[:2])
+    assert px == sorted(px)
+    assert warnings == ["OCR failed on page 3: stub failure"]
+
+
+def test_ocr_models_are_reused_across_calls(stub_paddleocr, monkeypatch):
+    built = []
+    new_engine = ocr_mod._new_ocr_engine
+
+    def counting_new_engine(lang, use_angle_cls):
+        built.append(lang)
+        return new_engine(lang, use_angle_cls)
+
+    monkeypatch.setattr(ocr_mod, "_new_ocr_engine", counting_new_engine)
+    images = [np.full((4, 1000, 3), 255, dtype=np.uint8)] * 4
+    for _ in range(3):
+        assert ocr_mod.ocr_images_parallel(images, workers=2)[0][0] == "1000px"
+    assert len(built) <= 2
@@ -0,0 +1,25 @@
+from greenbriar_scribe import segment
+
+
+def _classify(text, **kwargs):
+    args = dict(avg_size=None, page_median_size=None, page_width=0.0, bbox=None, repeated_headers_footers=set())
+    args.update(kwargs)
+    return segment.classify_role(text, **args)
+
+
+def test_math_score_counts_overlapping_categories():
+    # The table run "1 2 3" and the fraction "3/4" share a digit; both must score.
+    assert segment._is_table_like("1 2 3/4")
+    assert segment._math_score("1 2 3/4") == 1
+    assert segment._math_score("x^{2} = sin y") == 5
+
+
+def test_classify_role():
+    assert _classify("α ≤ β") == "math"
+    assert _classify("x^{2} = sin y") == "math_complex"
+    assert _classify("1. First item") == "list_item"
+    assert _classify("a) First item") == "list_item"
+    assert _classify("10 20 30") == "table_like"
+    assert _classify("Running header", repeated_headers_footers={"Running header"}) == "header"
+    assert _classify("A plain sentence about results.") == "paragraph"
+    assert _classify("   ") == "unknown"
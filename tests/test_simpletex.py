@@ -0,0 +1,101 @@
+import threading
+import time
+
+import fitz
+
+from greenbriar_scribe import simpletex
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    # Pages are told apart by their rendered width, read from the PNG header; narrower (earlier)
+    # pages answer more slowly so requests complete out of page order.
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.starts = []
+        self.inflight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, headers, files, data, timeout):
+        _, image, _ = files["file"]
+        width = int.from_bytes(image[16:20], "big")
+        with self._lock:
+            self.starts.append(time.monotonic())
+            self.inflight += 1
+            self.peak = max(self.peak, self.inflight)
+            failing = self.failures.get(width, 0) > 0
+            if failing:
+                self.failures[width] -= 1
+        time.sleep(max(0.0, 0.3 - width / 2000))
+        with self._lock:
+            self.inflight -= 1
+        if failing:
+            return _FakeResponse({"status": False})
+        return _FakeResponse({"status": True, "res": {"content": str(width)}, "request_id": width})
+
+    def close(self):
+        pass
+
+
+def _create_pdf(path, widths):
+    doc = fitz.open()
+    for width in widths:
+        doc.new_page(width=width, height=300)
+    doc.save(path)
+    doc.close()
+
+
+def _backend(session, **kwargs):
+    backend = simpletex.SimpleTexMarkdownBackend(simpletex.SimpleTexOptions(token="t", dpi=72, **kwargs))
+    backend._session = session
+    return backend
+
+
+def test_pdf_to_markdown_keeps_page_order(tmp_path):
+    widths = [100, 150, 200, 250, 300, 350]
+    pdf_path = tmp_path / "doc.pdf"
+    _create_pdf(str(pdf_path), widths)
+    session = _FakeSession()
+    result = _backend(session, qps=100, workers=3).pdf_to_markdown(str(pdf_path))
+    assert result["pages"] == 6
+    assert [p["page"] for p in result["pages_md"]] == [1, 2, 3, 4, 5, 6]
+    assert [p["markdown"] for p in result["pages_md"]] == [str(w) for w in widths]
+    assert result["full_markdown"].startswith("<!-- PAGE 1 -->\n100")
+    assert result["errors"] == []
+    assert session.peak > 1
+
+
+def test_pdf_to_markdown_retries_then_reports_errors(tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    _create_pdf(str(pdf_path), [100, 150, 200])
+    # Page 2 is rejected once and recovers on retry; page 3 is rejected on every attempt.
+    session = _FakeSession(failures={150: 1, 200: 5})
+    result = _backend(session, qps=100, workers=2, max_retries=1).pdf_to_markdown(str(pdf_path))
+    assert [p["page"] for p in result["pages_md"]] == [1, 2]
+    assert [e["page"] for e in result["errors"]] == [3]
+    assert "status=false" in result["errors"][0]["error"]
+    assert len(session.starts) == 5
+
+
+def test_requests_respect_qps(tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    _create_pdf(str(pdf_path), [200] * 8)
+    session = _FakeSession()
+    backend = _backend(session, qps=20, workers=4)
+    start = time.monotonic()
+    backend.pdf_to_markdown(str(pdf_path))
+    # The i-th request may not start before the i-th rate-limiter slot.
+    for i, ts in enumerate(sorted(session.starts)):
+        assert ts >= start + i / 20
+    assert session.peak > 1
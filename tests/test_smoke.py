@@ -174,3 +174,22 @@ def test_dehyphenation(tmp_path):
 
     assert "demonstration" in content
     assert "demon-" not in content
+
+
+def test_parallel_extraction_matches_sequential(tmp_path):
+    pdf_path = tmp_path / "long.pdf"
+    _create_text_pdf(
+        str(pdf_path),
+        [("Header", f"Body page {i}.", "Footer") for i in range(20)],
+    )
+    scribe = Scribe()
+    outputs = []
+    for workers in (1, 2):
+        out_dir = tmp_path / f"out{workers}"
+        opts = ScribeOptions(out_dir=str(out_dir), enable_ocr=False, extract_workers=workers)
+        result = scribe.process_pdf(str(pdf_path), opts)
+        assert not result.meta["warnings"]
+        outputs.append(_read_jsonl(result.segments_jsonl_path))
+
+    assert outputs[0] == outputs[1]
+    assert [seg["page"] for seg in outputs[1]] == sorted(seg["page"] for seg in outputs[1])
@@ -0,0 +1,54 @@
+import json
+
+from greenbriar_scribe import utils
+
+
+def _jsonl_roundtrip(path, records):
+    utils.jsonl_write(str(path), records)
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_jsonl_write_roundtrip(tmp_path, monkeypatch):
+    records = [
+        {"text": "公式 α ≤ β", "bbox": (72.0, 120.5, 520.0, 210.0), "confidence": None},
+        {"text": "", "bbox": None, "confidence": 0.91},
+    ]
+    expected = json.loads(json.dumps(records))
+    assert _jsonl_roundtrip(tmp_path / "fast.jsonl", records) == expected
+    monkeypatch.setattr(utils, "orjson", None)
+    assert _jsonl_roundtrip(tmp_path / "plain.jsonl", records) == expected
+
+
+def test_has_min_nonspace():
+    assert utils.has_min_nonspace("  a b\tc \n", 3)
+    assert not utils.has_min_nonspace("  a b\u3000\n", 3)
+    assert not utils.has_min_nonspace(None, 1)
+    assert utils.has_min_nonspace("", 0)
+
+
+def test_render_zoom_caps_long_side():
+    # US Letter at 250 DPI would be 2750px tall; the cap lowers it to 1280px.
+    zoom = utils.render_zoom(612, 792, 250, 1280)
+    assert round(792 * zoom) == 1280
+    assert utils.render_zoom(612, 792, 250, None) == 250 / 72.0
+    # Small pages are never upscaled beyond the requested DPI.
+    assert utils.render_zoom(100, 100, 72, 1280) == 1.0
+
+
+def test_json_write_matches_stdlib(tmp_path, monkeypatch):
+    payload = {"doc_id": "d", "warnings": ["公式 α"], "empty": [], "nested": {"a": [1, {"b": 2.5}]}, 3: None}
+    utils.json_write(str(tmp_path / "fast.json"), payload)
+    monkeypatch.setattr(utils, "orjson", None)
+    utils.json_write(str(tmp_path / "plain.json"), payload)
+    fast = (tmp_path / "fast.json").read_text(encoding="utf-8")
+    assert fast == (tmp_path / "plain.json").read_text(encoding="utf-8")
+    assert json.loads(fast)["3"] is None
+
+
+def test_markdown_to_text():
+    md = (
+        "<!-- PAGE 1 -->\n# Title\n\nSome **bold** and _emph_ text with $x^2$ inline.\n\n"
+        "$$\n\\int_0^1 f\n$$\n\n![fig](img.png)\n```\ncode\n```\nC# stays."
+    )
+    assert utils.markdown_to_text(md) == "Title Some bold and emph text with inline. C# stays."